@@ -1,8 +1,9 @@
 """
 discord_notifier.py — Discord webhook notification for Vlaamse Chroniqueur.
 
-Public function:
+Public functions:
     post_to_discord(week_start_date, script, doc_url)
+    post_to_discord_async(week_start_date, script, doc_url) → Future
 
 Posts a plain-text message to the configured Discord webhook with the
 topic, filming schedule summary, and a link to the Google Doc.
@@ -10,12 +11,26 @@ topic, filming schedule summary, and a link to the Google Doc.
 
 from __future__ import annotations
 
+import atexit
+import io
 import os
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import date
 
-import requests
+from http_session import make_session
 
 REQUEST_TIMEOUT = 10
+MAX_MESSAGE_CHARS = 2000  # Discord rejects longer webhook content with a 400
+
+# One pooled session per process (see http_session.py): repeat posts reuse the
+# TLS connection to discord.com. Only 429/5xx responses and failed connections
+# are retried, never a POST whose response was lost.
+_SESSION = make_session(pool_maxsize=4, methods=frozenset({"POST"}))
+
+# Background sender for post_to_discord_async; shut down with wait=True at
+# exit so a queued notification is never dropped when main() returns.
+_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="discord")
+atexit.register(_EXECUTOR.shutdown, wait=True)
 
 
 def post_to_discord(week_start_date: date, script: dict, doc_url: str) -> None:
@@ -30,7 +45,7 @@ def post_to_discord(week_start_date: date, script: dict, doc_url: str) -> None:
 
     message = _build_message(week_start_date, script, doc_url)
 
-    resp = requests.post(
+    resp = _SESSION.post(
         webhook_url,
         json={"content": message},
         timeout=REQUEST_TIMEOUT,
@@ -39,42 +54,76 @@ def post_to_discord(week_start_date: date, script: dict, doc_url: str) -> None:
     print("Discord notification sent.")
 
 
+def post_to_discord_async(week_start_date: date, script: dict, doc_url: str) -> Future:
+    """
+    Run post_to_discord on a background thread and return its Future.
+    Errors are raised from Future.result() / exposed via Future.exception().
+    From async code, prefer `await asyncio.to_thread(post_to_discord, ...)`.
+    """
+    return _EXECUTOR.submit(post_to_discord, week_start_date, script, doc_url)
+
+
 def _build_message(week_start_date: date, script: dict, doc_url: str) -> str:
     monday_str = week_start_date.strftime("%d %B %Y").lstrip("0")
     topic = script.get("topic", "Unknown Topic")
     period = script.get("period", "")
     location = script.get("location", "")
 
-    lines = [
-        f"**Vlaamse Chroniqueur \u2014 Week of {monday_str}**",
-        "",
-        f"Topic: {topic} ({period})" if period else f"Topic: {topic}",
-    ]
-
-    if location:
-        lines.append(f"Location: {location}")
-
-    filming_lines = []
-    for day_plan in script.get("shooting_plan", []):
-        day = day_plan.get("day", "")
-        day_date = day_plan.get("date", "")
-        weather = day_plan.get("weather", {})
-        condition = weather.get("condition", "unknown")
-        temp = weather.get("temp_c")
-        venue = day_plan.get("venue", "outdoor")
-
-        temp_str = f"{temp}\u00b0C" if temp is not None else "?"
-        filming_lines.append(f"  {day} {day_date}: {condition} {temp_str} \u2014 {venue}")
-
-    if filming_lines:
-        lines.append("")
-        lines.append("Filming days:")
-        lines.extend(filming_lines)
-
-    lines.extend([
-        "",
-        "Full script + editing guide:",
-        doc_url,
-    ])
-
-    return "\n".join(lines)
+    title = f"**Vlaamse Chroniqueur \u2014 Week of {monday_str}**\n\n"
+    footer = f"\n\nFull script + editing guide:\n{doc_url}"
+
+    # The title and doc link are always sent whole; the topic and location
+    # lines are cut to whatever room is left, and the filming days get the rest.
+    budget = MAX_MESSAGE_CHARS - len(title) - len(footer)
+    topic_line = _truncate(f"Topic: {topic} ({period})" if period else f"Topic: {topic}", budget)
+    budget -= len(topic_line)
+    location_line = _truncate(f"\nLocation: {location}" if location else "", budget)
+    budget -= len(location_line)
+
+    header = title + topic_line + location_line
+    return header + _filming_block(script.get("shooting_plan", []), budget) + footer
+
+
+def _truncate(text: str, limit: int) -> str:
+    """Cut text to at most `limit` characters, ending in an ellipsis if shortened."""
+    if len(text) <= limit:
+        return text
+    if limit <= 0:
+        return ""
+    return text[: limit - 1] + "\u2026"
+
+
+def _filming_block(shooting_plan: list[dict], budget: int) -> str:
+    """
+    Format the filming days, stopping with an ellipsis line before the block
+    would exceed `budget` characters so the message stays within Discord's limit.
+    """
+    heading = "\n\nFilming days:"
+    ellipsis = "\n  \u2026"
+    if not shooting_plan or budget < len(heading) + len(ellipsis):
+        return ""
+
+    out = io.StringIO()
+    out.write(heading)
+    last = len(shooting_plan) - 1
+    for i, day_plan in enumerate(shooting_plan):
+        line = _format_filming_day(day_plan)
+        reserve = len(ellipsis) if i < last else 0
+        if out.tell() + 1 + len(line) + reserve > budget:
+            out.write(ellipsis)
+            break
+        out.write("\n")
+        out.write(line)
+    return out.getvalue()
+
+
+def _format_filming_day(day_plan: dict) -> str:
+    day_get = day_plan.get
+    # "weather" may be present but null, as google_drive.py also allows
+    weather_get = (day_get("weather") or {}).get
+    temp = weather_get("temp_c")
+    temp_str = f"{temp}\u00b0C" if temp is not None else "?"
+    return (
+        f"  {day_get('day', '')} {day_get('date', '')}: "
+        f"{weather_get('condition', 'unknown')} {temp_str} \u2014 {day_get('venue', 'outdoor')}"
+    )
@@ -0,0 +1,65 @@
+"""
+disk_cache.py — small on-disk JSON cache for Vlaamse Chroniqueur.
+
+Public functions:
+    make_key(*parts)                     → hex digest identifying the inputs
+    load(namespace, key, max_age_s)      → cached value, or None on a miss
+    store(namespace, key, value)
+    clear(namespace=None)
+
+Entries live at {CACHE_DIR}/{namespace}/{key}.json and expire by file age.
+Used to skip repeat API calls when a run is retried with identical inputs.
+In CI, weekly.yml restores and saves .cache/ around the run with actions/cache.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import shutil
+import time
+from pathlib import Path
+
+import orjson
+
+CACHE_DIR = Path(os.environ.get("CHRONIQUEUR_CACHE_DIR", ".cache"))
+
+
+def make_key(*parts: object) -> str:
+    """Return a stable SHA-256 hex digest of the JSON-serialisable parts."""
+    return hashlib.sha256(orjson.dumps(parts, option=orjson.OPT_SORT_KEYS)).hexdigest()
+
+
+def load(namespace: str, key: str, max_age_s: float) -> object | None:
+    """
+    Return the value stored under key, or None if it is missing, older than
+    max_age_s seconds, or unreadable.
+    """
+    path = _path(namespace, key)
+    try:
+        if time.time() - path.stat().st_mtime > max_age_s:
+            return None
+        return orjson.loads(path.read_bytes())
+    except (OSError, orjson.JSONDecodeError):
+        return None
+
+
+def store(namespace: str, key: str, value: object) -> None:
+    """Write value under key. Failures are reported but never raised."""
+    path = _path(namespace, key)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_bytes(orjson.dumps(value))
+        tmp.replace(path)
+    except OSError as exc:
+        print(f"Warning: Could not write cache entry {path}: {exc}")
+
+
+def clear(namespace: str | None = None) -> None:
+    """Delete one namespace, or the whole cache directory if namespace is None."""
+    shutil.rmtree(CACHE_DIR / namespace if namespace else CACHE_DIR, ignore_errors=True)
+
+
+def _path(namespace: str, key: str) -> Path:
+    return CACHE_DIR / namespace / f"{key}.json"
@@ -5,24 +5,201 @@ Two-step pipeline:
   1. select_topic(week_start_date)       → topic dict
   2. generate_script(topic, weather)     → full production package dict
 
+generate_script plans a shared section outline first, then writes the Dutch
+package and the English script concurrently on an AsyncAnthropic client.
+
 Both steps use claude-sonnet-4-6.
 """
 
 from __future__ import annotations
 
+import asyncio
+import functools
+import io
 import json
 import os
 import re
 from datetime import date
 
 import anthropic
+import orjson
+
+import disk_cache
 
 MODEL = "claude-sonnet-4-6"
 
-REQUIRED_TOPIC_KEYS = {"topic", "location", "period", "wikipedia_url", "wikimedia_search_query"}
-REQUIRED_SCRIPT_KEYS = {"shooting_plan", "script_nl", "script_en", "editing_guide", "resources"}
-REQUIRED_INNER_SCRIPT_KEYS = {"intro", "sections", "outro"}
-REQUIRED_SECTION_KEYS = {"title", "commentary", "location_notes"}
+# Output ceilings with headroom over what each call needs: ~1,600 spoken words
+# plus JSON overhead for the English script, and the same in Dutch (which
+# tokenises longer) plus shooting plan, editing guide and resources.
+ENGLISH_MAX_TOKENS = 4096
+DUTCH_MAX_TOKENS = 6144
+
+# Only the most recent topics matter for picking the next one chronologically;
+# capping the list keeps select_topic's input size flat as the channel grows.
+MAX_PAST_TOPICS = 25
+
+# A retried run with the same week and past topics reuses the earlier pick
+# instead of paying for (and possibly changing) the topic selection.
+TOPIC_CACHE_TTL_S = 7 * 24 * 3600
+
+REQUIRED_TOPIC_KEYS = frozenset({"topic", "location", "period", "wikipedia_url", "wikimedia_search_query"})
+REQUIRED_SCRIPT_KEYS = frozenset({"shooting_plan", "script_nl", "script_en", "editing_guide", "resources"})
+REQUIRED_DUTCH_PACKAGE_KEYS = frozenset({"shooting_plan", "script_nl", "editing_guide", "resources"})
+REQUIRED_INNER_SCRIPT_KEYS = frozenset({"intro", "sections", "outro"})
+REQUIRED_SECTION_KEYS = frozenset({"title", "commentary", "location_notes"})
+REQUIRED_OUTLINE_KEYS = frozenset({"title", "location_notes"})
+
+_DECODER = json.JSONDecoder()
+_FENCE_RE = re.compile(r"```(?:json)?\s*([\s\S]*?)```")
+
+# Static prompt text lives at module level so every run sends byte-identical
+# prefixes — Anthropic's prompt cache is keyed on the exact prefix bytes.
+# Anything that changes per run (dates, topic, weather) goes in the user turn.
+#
+# _SHARED_SYSTEM is the one system prompt every call sends: channel context,
+# house style, and the instructions and JSON structure for each of the four
+# documents, with the user turn naming the document it wants. Keeping it in
+# one block puts it well above the 1024-token caching minimum. select_topic
+# writes it to the cache; the outline, Dutch package and English script calls
+# later in the same run read it back at a tenth of the input price.
+
+_SHARED_SYSTEM = (
+    "You work for 'Vlaamse Chroniqueur', a Flemish history YouTube channel. "
+    "Each week the host films on location in Flanders (modern Belgium, primarily "
+    "Ghent, Bruges, Antwerp, Ypres, Mechelen, or surrounding rural areas) and publishes "
+    "a 10-15 minute video of ~1,600 spoken words (130 wpm × 12 min).\n\n"
+    "House style is that of Dan Jones:\n"
+    "- Concrete names, dates, and numbers — not 'many soldiers' but 'around 4,000 men'\n"
+    "- Human scale — what did it feel like to be there?\n"
+    "- Short declarative sentences alongside longer ones\n"
+    "- No breathless superlatives ('the greatest', 'forever changed history')\n"
+    "- Historical context without turning it into a lecture\n\n"
+    "Respond with ONLY valid JSON. No prose before or after.\n\n"
+    "Each request names one of the four documents below. Follow that document's "
+    "instructions and use exactly its structure.\n\n"
+    "## TOPIC\n\n"
+    "As the channel's researcher, select ONE topic for this week's video.\n\n"
+    "The topic must be:\n"
+    "- A specific city district, building, monument, battlefield, castle, abbey, canal, "
+    "market square, or historical event rooted in Flanders\n"
+    "- Visually compelling — the host will film on location, so there must be something "
+    "to point a camera at\n"
+    "- Historically rich enough to fill 10-15 minutes of commentary (~1,600 spoken words)\n"
+    "- Spanning any era from Roman Flanders through the 20th century\n"
+    "- Not a generic national topic — keep it specifically Flemish\n\n"
+    "CHRONOLOGICAL ORDER: The channel covers Flemish history in chronological order. "
+    "The list of already-published topics will be provided. You must pick the next "
+    "logical topic that follows chronologically, so viewers build context step by step. "
+    "If no past topics exist, start from the earliest Flemish history.\n\n"
+    "{\n"
+    '  "topic": "Name of the topic (e.g., \'Gravensteen Castle\')",\n'
+    '  "location": "Specific filming location (e.g., \'Sint-Veerleplein 11, 9000 Ghent\')",\n'
+    '  "period": "Historical era and dates (e.g., \'Medieval, c. 1180-1350\')",\n'
+    '  "wikipedia_url": "https://en.wikipedia.org/wiki/EXACT_ARTICLE_TITLE",\n'
+    '  "wikimedia_search_query": "3-5 search keywords for Wikimedia Commons images",\n'
+    '  "rationale": "One sentence explaining why this follows chronologically"\n'
+    "}\n\n"
+    "Important: only include a wikipedia_url if you are certain the article exists "
+    "and covers this topic substantively. When in doubt, use: "
+    "\"https://en.wikipedia.org/wiki/Flanders\"\n\n"
+    "## OUTLINE\n\n"
+    "As the channel's scriptwriter, plan the section structure for this week's video. "
+    "The same structure is used for both the Flemish Dutch and the English script, "
+    "which are written separately from it.\n\n"
+    "Plan 4-5 sections of ~300 spoken words each, in the order the story should be told. "
+    "For each section give a short title and concrete location notes telling the host "
+    "where to stand and what to frame. If the filming venue is indoor, base the location "
+    "notes on a relevant indoor alternative (nearby museum, archive, library or church "
+    "connected to the topic).\n\n"
+    "[\n"
+    "  {\n"
+    '    "title": "Section title in English",\n'
+    '    "location_notes": "Stand at [specific spot]. Frame [feature] over your left shoulder."\n'
+    "  }\n"
+    "]\n\n"
+    "## PRODUCTION PACKAGE\n\n"
+    "Je bent de scriptschrijver van het kanaal. Schrijf in de huisstijl hierboven, maar "
+    "dan in warm, natuurlijk Vlaams Nederlands — niet formeel Hollands.\n\n"
+    "De presentator filmt op ÉÉN dag deze week. Dag, weer en filmlocatie (outdoor of "
+    "indoor) zijn opgegeven.\n\n"
+    "Verdeling: intro ~200 woorden, 4-5 secties ~300 woorden elk, outro ~150 woorden.\n"
+    "Gebruik precies de opgegeven sectiestructuur: dezelfde secties in dezelfde volgorde, "
+    "met titels en locatienotities vertaald naar Vlaams Nederlands.\n\n"
+    "{\n"
+    '  "shooting_plan": [\n'
+    "    {\n"
+    '      "day": "Maandag / Woensdag / Vrijdag",\n'
+    '      "date": "YYYY-MM-DD",\n'
+    '      "weather": {"condition": "...", "temp_c": N, "rain_mm": N},\n'
+    '      "venue": "outdoor of indoor",\n'
+    '      "shots": [\n'
+    '        "Brede establishingshot van de hoofdgevel",\n'
+    '        "Close-up van de toegangspoort",\n'
+    '        "Wandelend shot langs de noordmuur"\n'
+    "      ],\n"
+    '      "indoor_alternative": null\n'
+    "    }\n"
+    "  ],\n"
+    '  "script_nl": {\n'
+    '    "intro": "Volledige gesproken intro (~200 woorden) in Vlaams Nederlands.",\n'
+    '    "sections": [\n'
+    "      {\n"
+    '        "title": "Sectietitel",\n'
+    '        "commentary": "Volledige gesproken commentaar (~300 woorden) in Vlaams Nederlands.",\n'
+    '        "location_notes": "Sta op [specifieke plek]. Kadreer [kenmerk] over je linkerschouder."\n'
+    "      }\n"
+    "    ],\n"
+    '    "outro": "Volledige gesproken outro (~150 woorden) in Vlaams Nederlands."\n'
+    "  },\n"
+    '  "editing_guide": {\n'
+    '    "structure": "Beschrijf de algehele montageflow.",\n'
+    '    "transitions": "Aanbevelingen voor overgangsstijl.",\n'
+    '    "b_roll_suggestions": [\n'
+    '      "Drone-opname boven het dak bij gouden uur"\n'
+    "    ],\n"
+    '    "music_timing": "Wanneer muziek aanzwelt, wegvalt of stilte beter werkt."\n'
+    "  },\n"
+    '  "resources": {\n'
+    '    "footage_tips": [\n'
+    '      "Beeldbank Erfgoed Gent: https://beeldbank.gent.be — historische foto\'s"\n'
+    "    ],\n"
+    '    "music_suggestions": [\n'
+    '      "Free Music Archive — Medieval Flanders genre tag"\n'
+    "    ],\n"
+    '    "quote_sources": [\n'
+    '      "Primaire bron en auteur als een citaat wordt gebruikt"\n'
+    "    ],\n"
+    '    "archives": [\n'
+    '      "Stadsarchief Gent — originele bouwrecords uit de 12de eeuw"\n'
+    "    ]\n"
+    "  }\n"
+    "}\n\n"
+    "Regels:\n"
+    "- shooting_plan heeft precies ÉÉN item voor de opgegeven filmdag.\n"
+    "- Als venue 'indoor' is, zet indoor_alternative op een string die de specifieke "
+    "binnenlocatie beschrijft en waarom die relevant is voor het onderwerp.\n\n"
+    "## ENGLISH SCRIPT\n\n"
+    "As the channel's scriptwriter, write the English script.\n\n"
+    "Word distribution: intro ~200 words, sections ~300 words each, outro ~150 words.\n"
+    "You will be given the topic and the planned section structure. Use exactly these "
+    "sections in this order, with the given titles and location notes. The Flemish Dutch "
+    "script is written from the same outline, so cover the same historical content.\n\n"
+    "{\n"
+    '  "intro": "Full spoken intro (~200 words).",\n'
+    '  "sections": [\n'
+    "    {\n"
+    '      "title": "Section title in English",\n'
+    '      "commentary": "Full spoken commentary (~300 words).",\n'
+    '      "location_notes": "Stand at [specific spot]. Frame [feature] over your left shoulder."\n'
+    "    }\n"
+    "  ],\n"
+    '  "outro": "Full spoken outro (~150 words)."\n'
+    "}"
+)
+
+_SYSTEM_BLOCKS = [
+    {"type": "text", "text": _SHARED_SYSTEM, "cache_control": {"type": "ephemeral"}},
+]
 
 
 def select_topic(week_start_date: date, past_topics: list[str] | None = None) -> dict:
@@ -34,272 +211,259 @@ def select_topic(week_start_date: date, past_topics: list[str] | None = None) ->
 
     Returns a dict with keys:
         topic, location, period, wikipedia_url, wikimedia_search_query, rationale
+
+    Results are cached on disk for TOPIC_CACHE_TTL_S, keyed on the week and
+    the past topics, so re-running the same week returns the same topic.
     """
-    client = _build_client()
+    cache_key = disk_cache.make_key(week_start_date.isoformat(), past_topics or [])
+    cached = disk_cache.load("select_topic", cache_key, TOPIC_CACHE_TTL_S)
+    if cached is not None:
+        print(f"Topic selected (cached): {cached['topic']} — {cached.get('rationale', '')}")
+        return cached
 
-    system_msg = (
-        "You are a researcher for 'Vlaamse Chroniqueur', a Flemish history YouTube channel. "
-        "Each week the host films on location in Flanders (modern Belgium, primarily "
-        "Ghent, Bruges, Antwerp, Ypres, Mechelen, or surrounding rural areas).\n\n"
-        "Your task: select ONE topic for this week's video.\n\n"
-        "The topic must be:\n"
-        "- A specific city district, building, monument, battlefield, castle, abbey, canal, "
-        "market square, or historical event rooted in Flanders\n"
-        "- Visually compelling — the host will film on location, so there must be something "
-        "to point a camera at\n"
-        "- Historically rich enough to fill 10-15 minutes of commentary (~1,600 spoken words)\n"
-        "- Spanning any era from Roman Flanders through the 20th century\n"
-        "- Not a generic national topic — keep it specifically Flemish\n\n"
-        "CHRONOLOGICAL ORDER: The channel covers Flemish history in chronological order. "
-        "The list of already-published topics will be provided. You must pick the next "
-        "logical topic that follows chronologically, so viewers build context step by step. "
-        "If no past topics exist, start from the earliest Flemish history.\n\n"
-        "Respond with ONLY a valid JSON object. No prose before or after."
-    )
+    client = _build_client()
 
     past_section = ""
     if past_topics:
-        listed = "\n".join(f"  {i + 1}. {t}" for i, t in enumerate(past_topics))
+        recent = past_topics[-MAX_PAST_TOPICS:]
+        first_number = len(past_topics) - len(recent) + 1
+        listed = "\n".join(f"  {i}. {t}" for i, t in enumerate(recent, start=first_number))
+        heading = (
+            "Topics already published (in order)"
+            if len(recent) == len(past_topics)
+            else f"Most recent {len(recent)} of {len(past_topics)} topics already published (in order)"
+        )
         past_section = (
-            f"\nTopics already published (in order):\n{listed}\n\n"
+            f"\n{heading}:\n{listed}\n\n"
             "Pick the next topic that follows chronologically from the last one above. "
             "Make sure viewers of the previous episode will have useful context for this one.\n"
         )
 
     user_msg = (
+        "Document: TOPIC\n\n"
         f"Week starting: {week_start_date.strftime('%A %d %B %Y')}\n"
         f"{past_section}\n"
-        "Return JSON only:\n"
-        "{\n"
-        '  "topic": "Name of the topic (e.g., \'Gravensteen Castle\')",\n'
-        '  "location": "Specific filming location (e.g., \'Sint-Veerleplein 11, 9000 Ghent\')",\n'
-        '  "period": "Historical era and dates (e.g., \'Medieval, c. 1180-1350\')",\n'
-        '  "wikipedia_url": "https://en.wikipedia.org/wiki/EXACT_ARTICLE_TITLE",\n'
-        '  "wikimedia_search_query": "3-5 search keywords for Wikimedia Commons images",\n'
-        '  "rationale": "One sentence explaining why this follows chronologically"\n'
-        "}\n\n"
-        "Important: only include a wikipedia_url if you are certain the article exists "
-        "and covers this topic substantively. When in doubt, use: "
-        "\"https://en.wikipedia.org/wiki/Flanders\""
+        "Return the TOPIC document only."
     )
 
     message = client.messages.create(
         model=MODEL,
         max_tokens=512,
-        system=system_msg,
+        system=_SYSTEM_BLOCKS,
         messages=[{"role": "user", "content": user_msg}],
     )
+    _log_cache_usage(message, context="select_topic")
 
     raw = message.content[0].text
     topic = _parse_json_response(raw, context="select_topic")
     _validate_keys(topic, REQUIRED_TOPIC_KEYS, context="topic")
     print(f"Topic selected: {topic['topic']} — {topic.get('rationale', '')}")
+    disk_cache.store("select_topic", cache_key, topic)
     return topic
 
 
 def generate_script(topic: dict, filming_day: dict) -> dict:
+    """Synchronous entry point for generate_script_async."""
+    return asyncio.run(generate_script_async(topic, filming_day))
+
+
+async def generate_script_async(topic: dict, filming_day: dict) -> dict:
     """
-    Generate the full weekly production package in two API calls:
-      1. Dutch package: script_nl + shooting_plan + editing_guide + resources
-      2. English script: script_en (separate call to stay within token limits)
+    Generate the full weekly production package in three API calls:
+      1. Outline: section titles + location notes shared by both languages
+      2. Dutch package: script_nl + shooting_plan + editing_guide + resources
+      3. English script: script_en (separate call to stay within token limits)
 
+    Calls 2 and 3 only depend on the outline, so they run concurrently.
     Returns a merged dict with all five keys.
     """
-    print("      Generating Dutch script + production package...")
-    package = _generate_dutch_package(topic, filming_day)
+    async with _build_async_client() as client:
+        print("      Planning section outline...")
+        outline = await _generate_outline(client, topic, filming_day)
+
+        print("      Generating Dutch package and English script in parallel...")
+        package, script_en = await asyncio.gather(
+            _generate_dutch_package(client, topic, filming_day, outline),
+            _generate_english_script(client, topic, outline),
+        )
 
-    print("      Generating English script...")
-    script_en = _generate_english_script(topic, package["script_nl"])
     package["script_en"] = script_en
-
     _validate_script(package)
     return package
 
 
-def _generate_dutch_package(topic: dict, filming_day: dict) -> dict:
+async def _generate_outline(
+    client: anthropic.AsyncAnthropic, topic: dict, filming_day: dict
+) -> list[dict]:
     """
-    Call 1: Flemish Dutch script + shooting plan + editing guide + resources.
-    Returns dict with keys: shooting_plan, script_nl, editing_guide, resources.
+    Call 1: the section structure (title + location_notes per section) that
+    both language versions follow, so they can be written in parallel.
     """
-    client = _build_client()
-    venue = "outdoor" if filming_day.get("outdoor_ok", True) else "indoor"
-
-    system_msg = (
-        "You are the scriptwriter for 'Vlaamse Chroniqueur', een Vlaamse geschiedeniskanal op YouTube.\n\n"
-        "Schrijf in de stijl van Dan Jones (maar dan in het Nederlands):\n"
-        "- Concrete namen, data en cijfers — niet 'veel soldaten' maar 'ongeveer 4.000 man'\n"
-        "- Menselijke schaal — hoe voelde het om er zelf bij te zijn?\n"
-        "- Korte declaratieve zinnen afgewisseld met langere\n"
-        "- Geen superlatieven ('de grootste', 'veranderde alles voorgoed')\n"
-        "- Historische context zonder te vervallen in een lezing\n\n"
-        "De presentator filmt op ÉÉN dag deze week. Dag en weer zijn opgegeven.\n\n"
-        f"Filmlocatie deze week: {venue}. "
-        + (
-            "Regen > 2 mm — stel een relevante binnenlocatie voor (nabijgelegen museum, archief, "
-            "bibliotheek of kerk die verband houdt met het onderwerp)."
-            if venue == "indoor"
-            else "Het weer is geschikt voor buiten filmen op de locatie."
-        )
-        + "\n\n"
-        "Doellengte: ~1.600 woorden gesproken commentaar (130 wpm × 12 min).\n"
-        "Verdeling: intro ~200 woorden, 4-5 secties ~300 woorden elk, outro ~150 woorden.\n"
-        "Schrijf in warm, natuurlijk Vlaams Nederlands — niet formeel Hollands.\n\n"
-        "Antwoord met ALLEEN een geldig JSON-object. Geen tekst ervoor of erna."
-    )
-
+    venue = _venue(filming_day)
     user_msg = (
-        f"Onderwerp:\n{json.dumps(topic, indent=2, ensure_ascii=False)}\n\n"
-        f"Filmdag en weersomstandigheden:\n{json.dumps(filming_day, indent=2)}\n\n"
-        "Genereer het volledige weekelijkse productiepakket als één JSON-object.\n"
-        "Gebruik precies deze structuur:\n\n"
-        "{\n"
-        '  "shooting_plan": [\n'
-        "    {\n"
-        '      "day": "Maandag / Woensdag / Vrijdag",\n'
-        '      "date": "YYYY-MM-DD",\n'
-        '      "weather": {"condition": "...", "temp_c": N, "rain_mm": N},\n'
-        '      "venue": "outdoor of indoor",\n'
-        '      "shots": [\n'
-        '        "Brede establishingshot van de hoofdgevel",\n'
-        '        "Close-up van de toegangspoort",\n'
-        '        "Wandelend shot langs de noordmuur"\n'
-        "      ],\n"
-        '      "indoor_alternative": null\n'
-        "    }\n"
-        "  ],\n"
-        '  "script_nl": {\n'
-        '    "intro": "Volledige gesproken intro (~200 woorden) in Vlaams Nederlands.",\n'
-        '    "sections": [\n'
-        "      {\n"
-        '        "title": "Sectietitel",\n'
-        '        "commentary": "Volledige gesproken commentaar (~300 woorden) in Vlaams Nederlands.",\n'
-        '        "location_notes": "Sta op [specifieke plek]. Kadreer [kenmerk] over je linkerschouder."\n'
-        "      }\n"
-        "    ],\n"
-        '    "outro": "Volledige gesproken outro (~150 woorden) in Vlaams Nederlands."\n'
-        "  },\n"
-        '  "editing_guide": {\n'
-        '    "structure": "Beschrijf de algehele montageflow.",\n'
-        '    "transitions": "Aanbevelingen voor overgangsstijl.",\n'
-        '    "b_roll_suggestions": [\n'
-        '      "Drone-opname boven het dak bij gouden uur"\n'
-        "    ],\n"
-        '    "music_timing": "Wanneer muziek aanzwelt, wegvalt of stilte beter werkt."\n'
-        "  },\n"
-        '  "resources": {\n'
-        '    "footage_tips": [\n'
-        '      "Beeldbank Erfgoed Gent: https://beeldbank.gent.be — historische foto\'s"\n'
-        "    ],\n"
-        '    "music_suggestions": [\n'
-        '      "Free Music Archive — Medieval Flanders genre tag"\n'
-        "    ],\n"
-        '    "quote_sources": [\n'
-        '      "Primaire bron en auteur als een citaat wordt gebruikt"\n'
-        "    ],\n"
-        '    "archives": [\n'
-        '      "Stadsarchief Gent — originele bouwrecords uit de 12de eeuw"\n'
-        "    ]\n"
-        "  }\n"
-        "}\n\n"
-        "Regels:\n"
-        "- shooting_plan heeft precies ÉÉN item voor de filmdag hierboven.\n"
-        "- Als venue 'indoor' is, zet indoor_alternative op een string die de specifieke "
-        "binnenlocatie beschrijft en waarom die relevant is voor het onderwerp."
+        "Document: OUTLINE\n\n"
+        f"Topic:\n{_prompt_json(topic)}\n\n"
+        f"Filming venue this week: {venue}.\n\n"
+        "Plan the section structure. Return JSON only."
     )
 
-    message = client.messages.create(
+    message = await client.messages.create(
         model=MODEL,
-        max_tokens=8192,
-        system=system_msg,
+        max_tokens=1024,
+        system=_SYSTEM_BLOCKS,
         messages=[{"role": "user", "content": user_msg}],
     )
-    if message.stop_reason == "max_tokens":
-        raise ValueError(
-            "_generate_dutch_package: response was cut off (max_tokens reached)."
-        )
+    _log_cache_usage(message, context="_generate_outline")
     raw = message.content[0].text
+    outline = _parse_json_response(raw, context="_generate_outline")
+    if not isinstance(outline, list) or not outline:
+        raise ValueError(f"_generate_outline: expected a non-empty JSON array, got:\n{raw}")
+    for i, section in enumerate(outline):
+        _validate_keys(section, REQUIRED_OUTLINE_KEYS, context=f"outline[{i}]")
+    return outline
+
+
+async def _generate_dutch_package(
+    client: anthropic.AsyncAnthropic, topic: dict, filming_day: dict, outline: list[dict]
+) -> dict:
+    """
+    Call 2: Flemish Dutch script + shooting plan + editing guide + resources.
+    Returns dict with keys: shooting_plan, script_nl, editing_guide, resources.
+    """
+    venue = _venue(filming_day)
+    venue_note = (
+        "Regen > 2 mm — stel een relevante binnenlocatie voor (nabijgelegen museum, archief, "
+        "bibliotheek of kerk die verband houdt met het onderwerp)."
+        if venue == "indoor"
+        else "Het weer is geschikt voor buiten filmen op de locatie."
+    )
+
+    user_msg = (
+        "Document: PRODUCTION PACKAGE\n\n"
+        f"Onderwerp:\n{_prompt_json(topic)}\n\n"
+        f"Filmdag en weersomstandigheden:\n{_prompt_json(filming_day)}\n\n"
+        f"Filmlocatie deze week: {venue}. {venue_note}\n\n"
+        f"Sectiestructuur:\n{_prompt_json(outline)}\n\n"
+        "Genereer het volledige weekelijkse productiepakket als één JSON-object."
+    )
+
+    raw = await _stream_text(
+        client,
+        max_tokens=DUTCH_MAX_TOKENS,
+        user_msg=user_msg,
+        context="_generate_dutch_package",
+    )
     data = _parse_json_response(raw, context="_generate_dutch_package")
 
-    required = {"shooting_plan", "script_nl", "editing_guide", "resources"}
-    _validate_keys(data, required, context="dutch_package")
+    _validate_keys(data, REQUIRED_DUTCH_PACKAGE_KEYS, context="dutch_package")
     _validate_keys(data["script_nl"], REQUIRED_INNER_SCRIPT_KEYS, context="script_nl")
     return data
 
 
-def _generate_english_script(topic: dict, script_nl: dict) -> dict:
+async def _generate_english_script(
+    client: anthropic.AsyncAnthropic, topic: dict, outline: list[dict]
+) -> dict:
     """
-    Call 2: English-language script only, using the Dutch script's section
-    structure for consistency. Returns a script dict with intro/sections/outro.
+    Call 3: English-language script only, following the shared outline so it
+    matches the Dutch script. Returns a script dict with intro/sections/outro.
     """
-    client = _build_client()
-
-    # Pass section titles and location notes from the Dutch script so the
-    # English version uses the same structure and shot descriptions.
-    section_structure = [
-        {"title": s.get("title", ""), "location_notes": s.get("location_notes", "")}
-        for s in script_nl.get("sections", [])
-    ]
-
-    system_msg = (
-        "You are the scriptwriter for 'Vlaamse Chroniqueur', a Flemish history YouTube channel.\n\n"
-        "Write in the style of Dan Jones:\n"
-        "- Concrete names, dates, and numbers — not 'many soldiers' but 'around 4,000 men'\n"
-        "- Human scale — what did it feel like to be there?\n"
-        "- Short declarative sentences alongside longer ones\n"
-        "- No breathless superlatives ('the greatest', 'forever changed history')\n"
-        "- Historical context without turning it into a lecture\n\n"
-        "Target length: ~1,600 words total (130 wpm × 12 min).\n"
-        "Word distribution: intro ~200 words, sections ~300 words each, outro ~150 words.\n\n"
-        "Respond with ONLY a valid JSON object. No prose before or after."
+    user_msg = (
+        "Document: ENGLISH SCRIPT\n\n"
+        f"Topic:\n{_prompt_json(topic)}\n\n"
+        f"Section structure:\n{_prompt_json(outline)}\n\n"
+        "Write the English script for this video. Return JSON only."
     )
 
-    user_msg = (
-        f"Topic:\n{json.dumps(topic, indent=2, ensure_ascii=False)}\n\n"
-        "Write the English script for this video. Use exactly the same sections as the "
-        "Dutch script (same titles translated to English, same location notes translated "
-        "to English). Cover the same historical content.\n\n"
-        f"Section structure from Dutch script:\n{json.dumps(section_structure, indent=2, ensure_ascii=False)}\n\n"
-        "Return JSON only:\n"
-        "{\n"
-        '  "intro": "Full spoken intro (~200 words).",\n'
-        '  "sections": [\n'
-        "    {\n"
-        '      "title": "Section title in English",\n'
-        '      "commentary": "Full spoken commentary (~300 words).",\n'
-        '      "location_notes": "Stand at [specific spot]. Frame [feature] over your left shoulder."\n'
-        "    }\n"
-        "  ],\n"
-        '  "outro": "Full spoken outro (~150 words)."\n'
-        "}"
+    raw = await _stream_text(
+        client,
+        max_tokens=ENGLISH_MAX_TOKENS,
+        user_msg=user_msg,
+        context="_generate_english_script",
     )
+    data = _parse_json_response(raw, context="_generate_english_script")
+    _validate_keys(data, REQUIRED_INNER_SCRIPT_KEYS, context="script_en")
+    return data
 
-    message = client.messages.create(
+
+async def _stream_text(
+    client: anthropic.AsyncAnthropic,
+    *,
+    max_tokens: int,
+    user_msg: str,
+    context: str,
+) -> str:
+    """
+    Stream a completion and return its text.
+    Raises ValueError with the partial text if the response hit max_tokens.
+    """
+    buf = io.StringIO()
+    async with client.messages.stream(
         model=MODEL,
-        max_tokens=8192,
-        system=system_msg,
+        max_tokens=max_tokens,
+        system=_SYSTEM_BLOCKS,
         messages=[{"role": "user", "content": user_msg}],
-    )
+    ) as stream:
+        async for text in stream.text_stream:
+            buf.write(text)
+        message = await stream.get_final_message()
+
+    _log_cache_usage(message, context=context)
+    raw = buf.getvalue()
     if message.stop_reason == "max_tokens":
         raise ValueError(
-            "_generate_english_script: response was cut off (max_tokens reached)."
+            f"{context}: response was cut off (max_tokens={max_tokens} reached, "
+            f"{message.usage.output_tokens} output tokens).\n"
+            f"Partial response:\n{raw}"
         )
-    raw = message.content[0].text
-    data = _parse_json_response(raw, context="_generate_english_script")
-    _validate_keys(data, REQUIRED_INNER_SCRIPT_KEYS, context="script_en")
-    return data
+    return raw
+
+
+def _prompt_json(obj: object) -> str:
+    """Compact UTF-8 JSON for embedding in prompts — indentation only adds input tokens."""
+    return orjson.dumps(obj).decode()
 
 
+def _venue(filming_day: dict) -> str:
+    return "outdoor" if filming_day.get("outdoor_ok", True) else "indoor"
+
+
+@functools.lru_cache(maxsize=1)
 def _build_client() -> anthropic.Anthropic:
+    """
+    Return the process-wide Anthropic client so its connection pool is reused
+    across calls. Call _build_client.cache_clear() after changing
+    ANTHROPIC_API_KEY (e.g. when patching the environment in tests).
+    """
+    return anthropic.Anthropic(api_key=_api_key())
+
+
+def _build_async_client() -> anthropic.AsyncAnthropic:
+    # Not cached: an async client's connection pool is bound to the event loop
+    # it was first used on, and generate_script runs a fresh loop per call.
+    return anthropic.AsyncAnthropic(api_key=_api_key())
+
+
+def _api_key() -> str:
     api_key = os.environ.get("ANTHROPIC_API_KEY", "")
     if not api_key:
         raise RuntimeError("ANTHROPIC_API_KEY environment variable is not set.")
-    return anthropic.Anthropic(api_key=api_key)
+    return api_key
+
+
+def _log_cache_usage(message: anthropic.types.Message, context: str) -> None:
+    """Print prompt-cache hit/write token counts so cache effectiveness is visible in logs."""
+    usage = message.usage
+    print(
+        f"      [{context}] input tokens: {usage.input_tokens} uncached, "
+        f"{usage.cache_read_input_tokens or 0} cache read, "
+        f"{usage.cache_creation_input_tokens or 0} cache write"
+    )
 
 
 def _parse_json_response(raw: str, context: str) -> dict:
     """
-    Extract JSON from a Claude response, stripping markdown code fences if present.
-    Raises ValueError with context and raw text on parse failure.
+    Extract JSON from a Claude response, ignoring markdown code fences or prose
+    around it. Raises ValueError with context and raw text on parse failure.
     """
     if not raw or not raw.strip():
         raise ValueError(
@@ -307,8 +471,26 @@ def _parse_json_response(raw: str, context: str) -> dict:
             "Check that the API key is valid and the model is available."
         )
 
-    # Try to extract from ```json ... ``` or ``` ... ``` fences first
-    fenced = re.search(r"```(?:json)?\s*([\s\S]*?)```", raw)
+    # Fast path: the whole response is the JSON value, as the prompts ask.
+    text = raw.strip()
+    if text[0] in ("{", "["):
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            pass
+
+    # Otherwise decode from the first '{' or '[' and stop where the value
+    # closes, so a surrounding ```json fence or trailing prose is ignored.
+    starts = [i for i in (raw.find("{"), raw.find("[")) if i >= 0]
+    if starts:
+        try:
+            obj, _end = _DECODER.raw_decode(raw, min(starts))
+            return obj
+        except json.JSONDecodeError:
+            pass
+
+    # Slow path: extract from ```json ... ``` or ``` ... ``` fences
+    fenced = _FENCE_RE.search(raw)
     if fenced:
         candidate = fenced.group(1).strip()
         if not candidate:
@@ -329,8 +511,8 @@ def _parse_json_response(raw: str, context: str) -> dict:
             candidate = candidate[start:]
 
     try:
-        return json.loads(candidate)
-    except json.JSONDecodeError as exc:
+        return orjson.loads(candidate)
+    except orjson.JSONDecodeError as exc:
         raise ValueError(
             f"JSON parse failure in {context}.\n"
             f"Error: {exc}\n"
@@ -338,10 +520,10 @@ def _parse_json_response(raw: str, context: str) -> dict:
         ) from exc
 
 
-def _validate_keys(data: dict, required: set[str], context: str) -> None:
-    missing = required - set(data.keys())
-    if missing:
-        raise ValueError(f"Missing keys in {context}: {missing}")
+def _validate_keys(data: dict, required: frozenset[str], context: str) -> None:
+    if not data.keys() >= required:
+        missing = required - data.keys()
+        raise ValueError(f"Missing keys in {context}: {set(missing)}")
 
 
 def _validate_script(data: dict) -> None:
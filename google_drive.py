@@ -4,11 +4,11 @@ google_drive.py — Google Docs creation for Vlaamse Chroniqueur.
 Public function:
     create_weekly_doc(week_start_date, script) → shareable URL string
 
-Builds the document in four phases:
-    1. Build the full text string, recording StyleEvent and ImageSlot positions
-    2. Insert all text in one batchUpdate at index 1
-    3. Apply all formatting in chunked batchUpdate calls (50 requests per batch)
-    4. Insert images one at a time, backwards (highest index first)
+Builds the document in two phases:
+    1. Build the full text string, recording style events and ImageSlot positions
+    2. Send the text insert, all formatting and the images (backwards, highest
+       index first) as one batchUpdate, split at BATCH_SIZE requests if needed;
+       if Docs rejects an image, retry the images one at a time
 """
 
 from __future__ import annotations
@@ -17,16 +17,24 @@ import os
 from dataclasses import dataclass, field
 from datetime import date
 
+import google_auth_httplib2
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
 from googleapiclient.discovery import build
+from googleapiclient.errors import HttpError
+from googleapiclient.http import build_http
 
 SCOPES = [
     "https://www.googleapis.com/auth/documents",
     "https://www.googleapis.com/auth/drive",
 ]
 
-BATCH_SIZE = 50
+TITLE_PREFIX = "Vlaamse Chroniqueur \u2014 Week of "
+# Passed to every execute(); googleapiclient then retries 429 and 5xx
+# responses with randomised exponential backoff
+NUM_RETRIES = 4
+RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+BATCH_SIZE = 500                      # Requests per documents.batchUpdate call
 IMAGE_WIDTH_PT = 430
 IMAGE_HEIGHT_PT = 260
 
@@ -38,21 +46,81 @@ COLOR_STEEL = (0x1F, 0x5C, 0x99)      # Links
 COLOR_GREY = (0x55, 0x55, 0x55)       # Location notes
 
 
-@dataclass
-class StyleEvent:
-    start: int
-    end: int
-    named_style: str | None = None      # "TITLE", "HEADING_1", "HEADING_2", "NORMAL_TEXT"
-    color_rgb: tuple | None = None       # (r, g, b) integers 0-255
-    bold: bool = False
-    italic: bool = False
-    space_above_pt: int = 0
-    space_below_pt: int = 0
-    alignment: str | None = None        # "CENTER", "JUSTIFIED", "START"
-    link_url: str | None = None
+def _rgb_payload(rgb: tuple) -> dict:
+    r, g, b = rgb
+    return {"color": {"rgbColor": {"red": r / 255, "green": g / 255, "blue": b / 255}}}
 
 
-@dataclass
+# Request fragments that repeat on almost every event, built once. The request
+# body is only serialised, never mutated, so sharing them is safe.
+_COLOR_CACHE: dict[tuple, dict] = {
+    rgb: _rgb_payload(rgb)
+    for rgb in (COLOR_NAVY, COLOR_BURGUNDY, COLOR_GREEN, COLOR_STEEL, COLOR_GREY)
+}
+_SPACE_PT: dict[int, dict] = {
+    n: {"magnitude": n, "unit": "PT"} for n in (4, 6, 8, 10, 14, 16, 18, 20)
+}
+_FIELD_MASK_CACHE: dict[tuple[str, ...], str] = {}
+
+# Shared across create_weekly_doc and get_past_topics so a run refreshes the
+# OAuth token and builds each service client only once.
+_CREDS: Credentials | None = None
+_SERVICES: tuple | None = None
+
+
+@dataclass(slots=True)
+class EventBuffer:
+    """
+    Style events as parallel columns, one entry per event: event i covers
+    text offsets [starts[i], ends[i]) and is styled by the i-th entry of every
+    other column. An event is ten list appends rather than an object with its
+    own __dict__; rows() still builds one tuple per event as it is read.
+    """
+    starts: list[int] = field(default_factory=list)
+    ends: list[int] = field(default_factory=list)
+    named_styles: list[str | None] = field(default_factory=list)   # "TITLE", "HEADING_1", "HEADING_2", "NORMAL_TEXT"
+    colors_rgb: list[tuple | None] = field(default_factory=list)   # (r, g, b) integers 0-255
+    bolds: list[bool] = field(default_factory=list)
+    italics: list[bool] = field(default_factory=list)
+    spaces_above_pt: list[int] = field(default_factory=list)
+    spaces_below_pt: list[int] = field(default_factory=list)
+    alignments: list[str | None] = field(default_factory=list)     # "CENTER", "JUSTIFIED", "START"
+    link_urls: list[str | None] = field(default_factory=list)
+
+    def append(
+        self,
+        start: int,
+        end: int,
+        named_style: str | None = None,
+        color_rgb: tuple | None = None,
+        bold: bool = False,
+        italic: bool = False,
+        space_above_pt: int = 0,
+        space_below_pt: int = 0,
+        alignment: str | None = None,
+        link_url: str | None = None,
+    ) -> None:
+        self.starts.append(start)
+        self.ends.append(end)
+        self.named_styles.append(named_style)
+        self.colors_rgb.append(color_rgb)
+        self.bolds.append(bold)
+        self.italics.append(italic)
+        self.spaces_above_pt.append(space_above_pt)
+        self.spaces_below_pt.append(space_below_pt)
+        self.alignments.append(alignment)
+        self.link_urls.append(link_url)
+
+    def rows(self):
+        """Yield one tuple per event, in the order of the append() parameters."""
+        return zip(
+            self.starts, self.ends, self.named_styles, self.colors_rgb,
+            self.bolds, self.italics, self.spaces_above_pt,
+            self.spaces_below_pt, self.alignments, self.link_urls,
+        )
+
+
+@dataclass(slots=True)
 class ImageSlot:
     offset: int
     url: str
@@ -63,37 +131,28 @@ def create_weekly_doc(week_start_date: date, script: dict) -> str:
     Create a new Google Doc with the weekly production package and return
     the shareable URL.
     """
-    creds = _get_credentials()
-    docs = build("docs", "v1", credentials=creds)
-    drive = build("drive", "v3", credentials=creds)
+    docs, drive = _get_services()
 
     # Create empty document
     topic = script.get("topic", "Unknown Topic")
     date_str = week_start_date.strftime("%d %B %Y").lstrip("0") if hasattr(week_start_date, "strftime") else str(week_start_date)
-    title = f"Vlaamse Chroniqueur \u2014 Week of {date_str}: {topic}"
+    title = f"{TITLE_PREFIX}{date_str}: {topic}"
 
-    doc = docs.documents().create(body={"title": title}).execute()
+    doc = docs.documents().create(body={"title": title}).execute(
+        num_retries=NUM_RETRIES
+    )
     doc_id = doc["documentId"]
     print(f"Created Google Doc: {doc_id}")
 
     # Phase 1: Build text and collect style events / image slots
-    full_text, style_events, image_slots = _build_document_text(week_start_date, script)
-
-    # Phase 2: Insert all text at index 1
-    _insert_text(docs, doc_id, full_text)
+    full_text, style_events, image_slots = _build_document_text(script, date_str)
 
-    # Phase 3: Apply formatting
-    _apply_formatting(docs, doc_id, style_events)
-
-    # Phase 4: Insert images (backwards)
-    _insert_images(docs, doc_id, image_slots)
+    # Phase 2: Insert text, formatting and images in one batchUpdate
+    _populate_document(docs, doc_id, full_text, style_events, image_slots)
 
     # Move to folder and share
     folder_id = os.environ.get("GOOGLE_DRIVE_FOLDER_ID", "").strip()
-    if folder_id:
-        _move_to_folder(drive, doc_id, folder_id)
-
-    return _make_shareable(drive, doc_id)
+    return _move_and_share(drive, doc_id, folder_id)
 
 
 # ---------------------------------------------------------------------------
@@ -101,102 +160,112 @@ def create_weekly_doc(week_start_date: date, script: dict) -> str:
 # ---------------------------------------------------------------------------
 
 def _build_document_text(
-    week_start_date: date,
     script: dict,
-) -> tuple[str, list[StyleEvent], list[ImageSlot]]:
+    date_label: str,
+) -> tuple[str, EventBuffer, list[ImageSlot]]:
     """
     Assemble the full document text and record all formatting events and
-    image slot positions.
+    image slot positions. date_label is the formatted week date already used
+    in the document title.
     """
     buf: list[str] = []
-    events: list[StyleEvent] = []
+    events = EventBuffer()
     slots: list[ImageSlot] = []
+    cursor = [0]  # running len("".join(buf))
 
     def pos() -> int:
-        return sum(len(s) for s in buf)
+        return cursor[0]
 
     def add(text: str) -> None:
         buf.append(text)
+        cursor[0] += len(text)
+
+    def add_line(text: str) -> None:
+        # Two appends rather than text + "\n": avoids copying every paragraph
+        buf.append(text)
+        buf.append("\n")
+        cursor[0] += len(text) + 1
 
     def heading1(text: str, color: tuple = COLOR_NAVY) -> None:
         start = pos()
-        add(text + "\n")
-        events.append(StyleEvent(
+        add_line(text)
+        events.append(
             start=start, end=pos(),
             named_style="HEADING_1", color_rgb=color,
             space_above_pt=20, space_below_pt=6, alignment="START",
-        ))
+        )
 
     def heading2(text: str, color: tuple = COLOR_BURGUNDY) -> None:
         start = pos()
-        add(text + "\n")
-        events.append(StyleEvent(
+        add_line(text)
+        events.append(
             start=start, end=pos(),
             named_style="HEADING_2", color_rgb=color,
             space_above_pt=16, space_below_pt=4, alignment="START",
-        ))
+        )
 
     def body(text: str, italic: bool = False, color: tuple | None = None) -> None:
         start = pos()
-        add(text + "\n")
-        events.append(StyleEvent(
+        add_line(text)
+        events.append(
             start=start, end=pos(),
             named_style="NORMAL_TEXT",
             italic=italic,
             color_rgb=color,
             space_below_pt=8,
             alignment="JUSTIFIED",
-        ))
+        )
 
     def image_placeholder(url: str) -> None:
         start = pos()
         add("\n")
-        events.append(StyleEvent(
+        events.append(
             start=start, end=pos(),
             named_style="NORMAL_TEXT",
             alignment="CENTER",
             space_above_pt=10,
             space_below_pt=14,
-        ))
+        )
         slots.append(ImageSlot(offset=start, url=url))
 
     def link_line(label: str, url: str) -> None:
         start = pos()
-        add(f"{label}\n")
-        events.append(StyleEvent(
+        add_line(label)
+        events.append(
             start=start, end=pos(),
             named_style="NORMAL_TEXT",
             italic=True,
             color_rgb=COLOR_STEEL,
             link_url=url,
             space_below_pt=18,
-        ))
+        )
 
     # --- Title ---
-    date_label = week_start_date.strftime("%d %B %Y").lstrip("0") if hasattr(week_start_date, "strftime") else str(week_start_date)
     topic_name = script.get("topic", "")
     title_start = pos()
-    add(f"Vlaamse Chroniqueur \u2014 Week of {date_label}: {topic_name}\n")
-    events.append(StyleEvent(
+    add(f"{TITLE_PREFIX}{date_label}: {topic_name}\n")
+    events.append(
         start=title_start, end=pos(),
         named_style="TITLE",
         alignment="CENTER",
         space_below_pt=10,
-    ))
+    )
 
     # --- Filming Schedule ---
     heading1("Filming Schedule")
 
+    image_urls = script.get("image_urls") or []
     shooting_plan = script.get("shooting_plan", [])
     for i, day_plan in enumerate(shooting_plan):
-        day_label = day_plan.get("day", "")
-        day_date = day_plan.get("date", "")
-        weather = day_plan.get("weather", {})
-        condition = weather.get("condition", "unknown")
-        temp = weather.get("temp_c")
-        rain = weather.get("rain_mm", 0)
-        recommended = day_plan.get("recommended", False)
-        venue = day_plan.get("venue", "outdoor")
+        day_get = day_plan.get
+        day_label = day_get("day", "")
+        day_date = day_get("date", "")
+        weather_get = (day_get("weather") or {}).get
+        condition = weather_get("condition", "unknown")
+        temp = weather_get("temp_c")
+        rain = weather_get("rain_mm", 0)
+        recommended = day_get("recommended", False)
+        venue = day_get("venue", "outdoor")
 
         temp_str = f"{temp}\u00b0C" if temp is not None else "?"
         heading2(
@@ -207,37 +276,36 @@ def _build_document_text(
         body(f"Venue: {venue}")
         body(f"Rain: {rain} mm  |  Recommended: {'Yes' if recommended else 'No'}")
 
-        indoor_alt = day_plan.get("indoor_alternative")
+        indoor_alt = day_get("indoor_alternative")
         if indoor_alt:
             body(f"Indoor alternative: {indoor_alt}", italic=True, color=COLOR_GREY)
 
-        shots = day_plan.get("shots", [])
+        shots = day_get("shots", [])
         if shots:
             body("Suggested shots:")
             for shot in shots:
                 body(f"\u2022  {shot}")
 
         # Insert an image placeholder after the first filming day entry
-        if i == 0 and script.get("image_urls"):
-            first_url = script["image_urls"][0]
-            if first_url:
-                image_placeholder(first_url)
+        if i == 0 and image_urls and image_urls[0]:
+            image_placeholder(image_urls[0])
 
-    image_urls = script.get("image_urls", [])
-    image_idx = 1  # index 0 used in filming schedule
+    # Index 0 is used in the filming schedule; missing images are skipped
+    url_iter = (url for url in image_urls[1:] if url)
 
-    def render_script_section(heading_label: str, script_content: dict) -> None:
-        nonlocal image_idx
+    def next_image() -> None:
+        url = next(url_iter, None)
+        if url:
+            image_placeholder(url)
 
+    def render_script_section(heading_label: str, script_content: dict) -> None:
         heading1(heading_label)
 
         # Intro
         heading2("Intro")
         body(script_content.get("intro", ""))
 
-        if image_idx < len(image_urls) and image_urls[image_idx]:
-            image_placeholder(image_urls[image_idx])
-            image_idx += 1
+        next_image()
 
         # Sections
         for section in script_content.get("sections", []):
@@ -247,9 +315,7 @@ def _build_document_text(
                 body(f"Locatie / Location: {loc_notes}", italic=True, color=COLOR_GREY)
             body(section.get("commentary", ""))
 
-            if image_idx < len(image_urls) and image_urls[image_idx]:
-                image_placeholder(image_urls[image_idx])
-                image_idx += 1
+            next_image()
 
         # Outro
         heading2("Outro")
@@ -305,171 +371,280 @@ def _build_document_text(
 
 
 # ---------------------------------------------------------------------------
-# Phase 2: Insert text
+# Phase 2: Populate the document
 # ---------------------------------------------------------------------------
 
-def _insert_text(docs, doc_id: str, text: str) -> None:
+def _populate_document(
+    docs,
+    doc_id: str,
+    text: str,
+    events: EventBuffer,
+    slots: list[ImageSlot],
+) -> None:
+    """
+    Send the text insert, formatting and image inserts in as few batchUpdate
+    calls as possible. A batchUpdate applies its requests in order, so the
+    text goes first, the style ranges follow, and the images go last, highest
+    offset first, so each insert leaves the lower offsets valid.
+
+    Each call is atomic: if Docs cannot fetch one image it rejects the whole
+    call. The images therefore ride along with the last chunk only, and if
+    that chunk is rejected it is resent without them and the images are
+    inserted one at a time so only the bad image is skipped.
+    """
+    requests = [{"insertText": {"location": {"index": 1}, "text": text}}]
+    requests.extend(_formatting_requests(events))
+    image_requests = [
+        _image_request(slot)
+        for slot in sorted(slots, key=lambda s: s.offset, reverse=True)
+    ]
+
+    chunks = [requests[i : i + BATCH_SIZE] for i in range(0, len(requests), BATCH_SIZE)]
+    for chunk in chunks[:-1]:
+        _batch_update(docs, doc_id, chunk)
+
+    try:
+        _batch_update(docs, doc_id, chunks[-1] + image_requests)
+    except HttpError as exc:
+        if not image_requests:
+            raise
+        print(f"Warning: Batched image insert failed ({exc}); retrying images one at a time.")
+        _batch_update(docs, doc_id, chunks[-1])
+        _insert_images(docs, doc_id, slots)
+
+
+def _batch_update(docs, doc_id: str, requests: list[dict]) -> None:
     docs.documents().batchUpdate(
-        documentId=doc_id,
-        body={
-            "requests": [
-                {
-                    "insertText": {
-                        "location": {"index": 1},
-                        "text": text,
-                    }
-                }
-            ]
-        },
-    ).execute()
+        documentId=doc_id, body={"requests": requests}
+    ).execute(num_retries=NUM_RETRIES)
 
 
-# ---------------------------------------------------------------------------
-# Phase 3: Apply formatting
-# ---------------------------------------------------------------------------
+def _formatting_requests(events: EventBuffer) -> list[dict]:
+    """
+    Turn style events into updateParagraphStyle / updateTextStyle requests.
 
-def _apply_formatting(docs, doc_id: str, events: list[StyleEvent]) -> None:
+    Runs of adjacent events with the same style (consecutive body paragraphs,
+    bullet lists) are coalesced into one request spanning the whole run, and
+    a paragraph style equal to the default the inserted text already has
+    (plain NORMAL_TEXT) is not sent at all.
+    """
     requests = []
-    for ev in events:
+    last_para: dict | None = None
+    last_text: dict | None = None
+    for (
+        start, end, named_style, color_rgb, bold, italic,
+        space_above_pt, space_below_pt, alignment, link_url,
+    ) in events.rows():
         # Google Docs indices are 1-based after our text insert at index 1
-        start = ev.start + 1
-        end = ev.end + 1
-
-        if ev.named_style:
-            para_req: dict = {
-                "paragraphStyle": {},
-                "fields": "",
-            }
+        start += 1
+        end += 1
+
+        if named_style and not _is_default_paragraph(
+            named_style, alignment, space_above_pt, space_below_pt
+        ):
+            para_style: dict = {}
             style_fields = []
 
-            if ev.named_style:
-                para_req["paragraphStyle"]["namedStyleType"] = ev.named_style
-                style_fields.append("namedStyleType")
+            para_style["namedStyleType"] = named_style
+            style_fields.append("namedStyleType")
 
-            if ev.alignment:
-                para_req["paragraphStyle"]["alignment"] = ev.alignment
+            if alignment:
+                para_style["alignment"] = alignment
                 style_fields.append("alignment")
 
-            if ev.space_above_pt:
-                para_req["paragraphStyle"]["spaceAbove"] = {
-                    "magnitude": ev.space_above_pt, "unit": "PT"
-                }
+            if space_above_pt:
+                para_style["spaceAbove"] = (
+                    _SPACE_PT.get(space_above_pt)
+                    or {"magnitude": space_above_pt, "unit": "PT"}
+                )
                 style_fields.append("spaceAbove")
 
-            if ev.space_below_pt:
-                para_req["paragraphStyle"]["spaceBelow"] = {
-                    "magnitude": ev.space_below_pt, "unit": "PT"
-                }
+            if space_below_pt:
+                para_style["spaceBelow"] = (
+                    _SPACE_PT.get(space_below_pt)
+                    or {"magnitude": space_below_pt, "unit": "PT"}
+                )
                 style_fields.append("spaceBelow")
 
-            para_req["fields"] = ",".join(style_fields)
-            requests.append({
-                "updateParagraphStyle": {
+            if _extends(last_para, start, "paragraphStyle", para_style):
+                last_para["range"]["endIndex"] = end
+            else:
+                last_para = {
                     "range": {"startIndex": start, "endIndex": end},
-                    **para_req,
+                    "paragraphStyle": para_style,
+                    "fields": _field_mask(style_fields),
                 }
-            })
+                requests.append({"updateParagraphStyle": last_para})
 
         # Text style (colour, bold, italic, link)
         text_style: dict = {}
         text_fields = []
 
-        if ev.color_rgb:
-            r, g, b = ev.color_rgb
-            text_style["foregroundColor"] = {
-                "color": {
-                    "rgbColor": {
-                        "red": r / 255,
-                        "green": g / 255,
-                        "blue": b / 255,
-                    }
-                }
-            }
+        if color_rgb:
+            text_style["foregroundColor"] = (
+                _COLOR_CACHE.get(color_rgb) or _rgb_payload(color_rgb)
+            )
             text_fields.append("foregroundColor")
 
-        if ev.bold:
+        if bold:
             text_style["bold"] = True
             text_fields.append("bold")
 
-        if ev.italic:
+        if italic:
             text_style["italic"] = True
             text_fields.append("italic")
 
-        if ev.link_url:
-            text_style["link"] = {"url": ev.link_url}
+        if link_url:
+            text_style["link"] = {"url": link_url}
             text_fields.append("link")
 
         if text_style:
-            requests.append({
-                "updateTextStyle": {
+            if _extends(last_text, start, "textStyle", text_style):
+                last_text["range"]["endIndex"] = end
+            else:
+                last_text = {
                     "range": {"startIndex": start, "endIndex": end},
                     "textStyle": text_style,
-                    "fields": ",".join(text_fields),
+                    "fields": _field_mask(text_fields),
                 }
-            })
+                requests.append({"updateTextStyle": last_text})
 
-    # Apply in chunks of BATCH_SIZE
-    for i in range(0, len(requests), BATCH_SIZE):
-        chunk = requests[i : i + BATCH_SIZE]
-        docs.documents().batchUpdate(
-            documentId=doc_id, body={"requests": chunk}
-        ).execute()
+    return requests
 
 
-# ---------------------------------------------------------------------------
-# Phase 4: Insert images (backwards)
-# ---------------------------------------------------------------------------
+def _field_mask(fields: list[str]) -> str:
+    """
+    Return the comma-joined field mask, memoised. Fields are always appended
+    in the same order, so the tuple is a canonical key for the small set of
+    combinations that occur.
+    """
+    key = tuple(fields)
+    mask = _FIELD_MASK_CACHE.get(key)
+    if mask is None:
+        mask = _FIELD_MASK_CACHE[key] = ",".join(key)
+    return mask
+
+
+def _is_default_paragraph(
+    named_style: str,
+    alignment: str | None,
+    space_above_pt: int,
+    space_below_pt: int,
+) -> bool:
+    """True if the style asks for nothing beyond the inserted text's default."""
+    return (
+        named_style == "NORMAL_TEXT"
+        and alignment in (None, "START")
+        and not space_above_pt
+        and not space_below_pt
+    )
+
+
+def _extends(previous: dict | None, start: int, key: str, style: dict) -> bool:
+    """True if previous ends at start with the same style, so it can be widened."""
+    return (
+        previous is not None
+        and previous["range"]["endIndex"] == start
+        and previous[key] == style
+    )
+
 
 def _insert_images(docs, doc_id: str, slots: list[ImageSlot]) -> None:
+    """Insert images one call at a time, backwards, skipping any that fail."""
     for slot in sorted(slots, key=lambda s: s.offset, reverse=True):
         try:
-            docs.documents().batchUpdate(
-                documentId=doc_id,
-                body={
-                    "requests": [
-                        {
-                            "insertInlineImage": {
-                                "location": {"index": slot.offset + 1},
-                                "uri": slot.url,
-                                "objectSize": {
-                                    "height": {"magnitude": IMAGE_HEIGHT_PT, "unit": "PT"},
-                                    "width": {"magnitude": IMAGE_WIDTH_PT, "unit": "PT"},
-                                },
-                            }
-                        }
-                    ]
-                },
-            ).execute()
+            _batch_update(docs, doc_id, [_image_request(slot)])
         except Exception as exc:
             print(f"Warning: Could not insert image {slot.url}: {exc}")
 
 
+def _image_request(slot: ImageSlot) -> dict:
+    return {
+        "insertInlineImage": {
+            "location": {"index": slot.offset + 1},
+            "uri": slot.url,
+            "objectSize": {
+                "height": {"magnitude": IMAGE_HEIGHT_PT, "unit": "PT"},
+                "width": {"magnitude": IMAGE_WIDTH_PT, "unit": "PT"},
+            },
+        }
+    }
+
+
 # ---------------------------------------------------------------------------
 # Drive helpers
 # ---------------------------------------------------------------------------
 
+def _move_and_share(drive, doc_id: str, folder_id: str) -> str:
+    """
+    Move the doc into folder_id (if set), make it readable by anyone with the
+    link, and return that link. The three calls are independent of each other,
+    so they go out in one HTTP batch.
+    """
+    requests = {}
+    if folder_id:
+        # documents.create always puts a new doc in My Drive, so its one
+        # parent is "root" and no lookup is needed before the batch
+        requests["move"] = drive.files().update(
+            fileId=doc_id,
+            addParents=folder_id,
+            removeParents="root",
+            fields="id",
+        )
+    requests["share"] = drive.permissions().create(
+        fileId=doc_id,
+        body={"type": "anyone", "role": "reader"},
+    )
+    requests["link"] = drive.files().get(fileId=doc_id, fields="webViewLink")
+
+    responses: dict[str, dict] = {}
+    failed: dict[str, HttpError] = {}
+
+    def on_response(request_id, response, exception) -> None:
+        if exception is not None:
+            failed[request_id] = exception
+        else:
+            responses[request_id] = response
+
+    batch = drive.new_batch_http_request(callback=on_response)
+    for request_id, request in requests.items():
+        batch.add(request, request_id=request_id)
+    try:
+        batch.execute()
+    except HttpError as exc:
+        if not _is_transient(exc):
+            raise
+        failed.update((rid, exc) for rid in requests if rid not in responses)
+
+    # A batch has no retry of its own: resend transient failures one by one
+    for request_id, exc in failed.items():
+        if request_id == "move" and not _is_transient(exc):
+            print(f"Warning: Moving doc out of My Drive root failed ({exc}); looking up its parents.")
+            _move_to_folder(drive, doc_id, folder_id)
+        elif not _is_transient(exc):
+            raise exc
+        else:
+            responses[request_id] = requests[request_id].execute(num_retries=NUM_RETRIES)
+
+    return responses["link"]["webViewLink"]
+
+
 def _move_to_folder(drive, doc_id: str, folder_id: str) -> None:
+    """Move the doc into folder_id, replacing whatever parents it has now."""
     file_metadata = drive.files().get(
         fileId=doc_id, fields="parents"
-    ).execute()
+    ).execute(num_retries=NUM_RETRIES)
     current_parents = ",".join(file_metadata.get("parents", []))
     drive.files().update(
         fileId=doc_id,
         addParents=folder_id,
         removeParents=current_parents,
-        fields="id, parents",
-    ).execute()
+        fields="id",
+    ).execute(num_retries=NUM_RETRIES)
 
 
-def _make_shareable(drive, doc_id: str) -> str:
-    drive.permissions().create(
-        fileId=doc_id,
-        body={"type": "anyone", "role": "reader"},
-    ).execute()
-    file_data = drive.files().get(
-        fileId=doc_id, fields="webViewLink"
-    ).execute()
-    return file_data["webViewLink"]
+def _is_transient(exc: HttpError) -> bool:
+    return exc.resp.status in RETRYABLE_STATUSES
 
 
 def get_past_topics(folder_id: str) -> list[str]:
@@ -479,23 +654,23 @@ def get_past_topics(folder_id: str) -> list[str]:
 
     Document titles follow the pattern:
         "Vlaamse Chroniqueur — Week of {date}: {topic}"
+    Docs whose title does not start with that prefix are ignored.
 
     Returns an empty list if the folder is empty, the env var is unset, or any
     error occurs during the Drive API call.
     """
     try:
-        creds = _get_credentials()
-        drive = build("drive", "v3", credentials=creds)
+        _, drive = _get_services()
         results = drive.files().list(
             q=(
                 f"'{folder_id}' in parents "
                 "and mimeType='application/vnd.google-apps.document' "
                 "and trashed=false"
             ),
-            fields="files(name, createdTime)",
+            fields="files(name)",
             orderBy="createdTime asc",
             pageSize=100,
-        ).execute()
+        ).execute(num_retries=NUM_RETRIES)
     except Exception as exc:
         print(f"Warning: Could not fetch past topics from Drive: {exc}")
         return []
@@ -503,22 +678,47 @@ def get_past_topics(folder_id: str) -> list[str]:
     topics: list[str] = []
     for f in results.get("files", []):
         name = f.get("name", "")
-        # Parse "Vlaamse Chroniqueur — Week of ...: {topic}"
-        if ":" in name:
-            topic = name.split(":", 1)[1].strip()
-            if topic:
-                topics.append(topic)
+        if not name.startswith(TITLE_PREFIX):
+            continue
+        # Parse "Vlaamse Chroniqueur — Week of ...: {topic}"; the topic itself
+        # may contain a colon, so split on the first one only
+        _, sep, topic = name.partition(":")
+        topic = topic.strip()
+        if sep and topic:
+            topics.append(topic)
     return topics
 
 
+def _get_services():
+    """Return the (docs, drive) service clients, built once per process."""
+    global _SERVICES
+    if _SERVICES is None:
+        # One authorised transport for both services, so every call and HTTP
+        # batch in a run reuses the same keep-alive connections. build_http()
+        # is googleapiclient's own default transport (timeout, 308 handling).
+        http = google_auth_httplib2.AuthorizedHttp(_get_credentials(), http=build_http())
+        _SERVICES = (
+            build("docs", "v1", http=http),
+            build("drive", "v3", http=http),
+        )
+    return _SERVICES
+
+
 def _get_credentials() -> Credentials:
-    creds = Credentials(
-        token=None,
-        refresh_token=os.environ["GOOGLE_REFRESH_TOKEN"],
-        token_uri="https://oauth2.googleapis.com/token",
-        client_id=os.environ["GOOGLE_CLIENT_ID"],
-        client_secret=os.environ["GOOGLE_CLIENT_SECRET"],
-        scopes=SCOPES,
-    )
-    creds.refresh(Request())
-    return creds
+    """
+    Return the cached OAuth credentials, refreshing the access token only
+    when there is none yet or it has expired.
+    """
+    global _CREDS
+    if _CREDS is None:
+        _CREDS = Credentials(
+            token=None,
+            refresh_token=os.environ["GOOGLE_REFRESH_TOKEN"],
+            token_uri="https://oauth2.googleapis.com/token",
+            client_id=os.environ["GOOGLE_CLIENT_ID"],
+            client_secret=os.environ["GOOGLE_CLIENT_SECRET"],
+            scopes=SCOPES,
+        )
+    if not _CREDS.valid:
+        _CREDS.refresh(Request())
+    return _CREDS
@@ -0,0 +1,55 @@
+"""
+http_session.py — shared requests.Session setup for Vlaamse Chroniqueur.
+
+Public function:
+    make_session(pool_maxsize, methods, pool_connections=1) → requests.Session
+
+weather.py, wikimedia.py and discord_notifier.py each keep one module-level
+session built here, so their calls reuse keep-alive connections instead of
+paying a TLS handshake each.
+"""
+
+from __future__ import annotations
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
+
+RETRY_TOTAL = 3
+RETRY_BACKOFF_FACTOR = 0.5
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+def make_session(
+    pool_maxsize: int, methods: frozenset[str], pool_connections: int = 1
+) -> requests.Session:
+    """
+    Return a pooled HTTPS session that retries `methods` with backoff.
+
+    Rate-limit (429) and transient 5xx responses are retried (honouring
+    Retry-After) before raise_for_status sees them, as are failed connections.
+    Read timeouts and dropped connections are only retried when every method
+    is idempotent: a POST may already have been accepted by the server.
+    Compression is requested explicitly, with every codec urllib3 can decode.
+    """
+    idempotent = methods <= Retry.DEFAULT_ALLOWED_METHODS
+    session = requests.Session()
+    session.headers["Accept-Encoding"] = ACCEPT_ENCODING
+    session.mount(
+        "https://",
+        HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            max_retries=Retry(
+                total=RETRY_TOTAL,
+                read=None if idempotent else 0,
+                other=None if idempotent else 0,
+                backoff_factor=RETRY_BACKOFF_FACTOR,
+                status_forcelist=RETRY_STATUSES,
+                allowed_methods=methods,
+                raise_on_status=False,
+            ),
+        ),
+    )
+    return session
@@ -7,33 +7,35 @@ Pipeline:
     3. Geocode the topic location to get lat/lon
     4. Fetch weather at the topic location for each filming date
     5. Ask Claude to generate the full script + production package (step 2)
-    6. Find Wikimedia Commons images for the topic
+    6. Find Wikimedia Commons images for the topic (started in the background
+       right after step 2, overlapping steps 3-5)
     7. Create a formatted Google Doc
     8. Post a summary to Discord
 """
 
 from __future__ import annotations
 
+import logging
 import os
 import sys
-import time
 import traceback
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import date, timedelta
 
 from dotenv import load_dotenv
 
-from discord_notifier import post_to_discord
+from discord_notifier import post_to_discord_async
 from generator import generate_script, select_topic
 from google_drive import create_weekly_doc, get_past_topics
 from weather import geocode_location, get_weekly_weather
-from wikimedia import find_image_url
-
-# Courtesy delay between Wikimedia API calls (seconds)
-WIKIMEDIA_DELAY = 0.5
+from wikimedia import find_image_urls
 
 
 def main() -> None:
     load_dotenv()
+    # weather.py and wikimedia.py report warnings through logging; records from
+    # libraries pass through here too, so label each with its real level
+    logging.basicConfig(level=logging.WARNING, format="%(levelname)s (%(name)s): %(message)s")
 
     today = date.today()
     filming_dates = get_upcoming_filming_dates(today)
@@ -58,6 +60,13 @@ def main() -> None:
         print("\n[1/6] Selecting topic...")
         topic = select_topic(monday, past_topics)
 
+        # The image search only needs the topic, so start it now and let it
+        # run while we geocode, fetch weather and generate the script
+        image_queries = _build_image_queries(topic)
+        image_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="wikimedia")
+        image_future = image_pool.submit(find_image_urls, image_queries)
+        image_pool.shutdown(wait=False)
+
         # Step 2: Geocode the filming location
         print(f"\n[2/6] Geocoding location: {topic['location']}")
         try:
@@ -91,14 +100,10 @@ def main() -> None:
 
         # Step 5: Find Wikimedia images
         print("\n[5/6] Searching for images...")
-        image_queries = _build_image_queries(topic)
-        image_urls: list[str | None] = []
-        for query in image_queries:
-            url = find_image_url(query)
+        image_urls = image_future.result()
+        for query, url in zip(image_queries, image_urls):
             status = "found" if url else "not found"
             print(f"      '{query}' → {status}")
-            image_urls.append(url)
-            time.sleep(WIKIMEDIA_DELAY)
         script["image_urls"] = image_urls
 
         # Step 6: Create Google Doc
@@ -106,12 +111,10 @@ def main() -> None:
         doc_url = create_weekly_doc(monday, script)
         print(f"      Doc URL: {doc_url}")
 
-        # Step 7: Notify Discord (non-fatal)
+        # Step 7: Notify Discord (non-fatal, delivered in the background)
         print("\n[7/7] Posting to Discord...")
-        try:
-            post_to_discord(monday, script, doc_url)
-        except Exception as discord_exc:
-            print(f"Warning: Discord notification failed: {discord_exc}")
+        discord_future = post_to_discord_async(monday, script, doc_url)
+        discord_future.add_done_callback(_report_discord_failure)
 
         print(f"\nDone. Script ready for week of {monday.isoformat()}.")
 
@@ -121,6 +124,12 @@ def main() -> None:
         sys.exit(1)
 
 
+def _report_discord_failure(future: Future) -> None:
+    exc = future.exception()
+    if exc is not None:
+        print(f"Warning: Discord notification failed: {exc}")
+
+
 def get_upcoming_filming_dates(run_date: date) -> list[date]:
     """
     Return [Monday, Wednesday, Friday] of the upcoming week.
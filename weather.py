@@ -1,23 +1,33 @@
 """
 Weather module for Vlaamse Chroniqueur.
 
-Provides two public functions:
+Provides three public functions:
   - geocode_location(location_name) → (latitude, longitude)
   - get_weekly_weather(lat, lon, filming_dates) → list of weather dicts
+  - clear_cache()
 
 Uses Open-Meteo (free, no API key required) for both geocoding and forecasting.
+Geocoding results and forecasts are cached on disk (see disk_cache.py).
 """
 
 from __future__ import annotations
 
+import logging
 from datetime import date
 
-import requests
+import orjson
+
+import disk_cache
+from http_session import make_session
+
+logger = logging.getLogger(__name__)
 
 GEOCODING_URL = "https://geocoding-api.open-meteo.com/v1/search"
 FORECAST_URL = "https://api.open-meteo.com/v1/forecast"
 RAIN_THRESHOLD_MM = 2.0
 REQUEST_TIMEOUT = 10
+GEOCODE_CACHE_TTL_S = 30 * 24 * 3600  # Place names do not move
+FORECAST_CACHE_TTL_S = 3600           # Open-Meteo updates forecasts hourly
 
 # WMO Weather Interpretation Codes (WW codes)
 WMO_CODE_MAP: dict[int, str] = {
@@ -51,6 +61,15 @@ WMO_CODE_MAP: dict[int, str] = {
     99: "thunderstorm with heavy hail",
 }
 
+# One pooled session per process (see http_session.py); two hosts, geocoding
+# and forecast, so one connection pool each.
+_SESSION = make_session(pool_maxsize=4, methods=frozenset({"GET"}), pool_connections=2)
+
+# Direct-indexed view of WMO_CODE_MAP (codes are 0-99): a tuple subscript
+# instead of a hash lookup; None marks codes the map does not define.
+_WMO_BY_CODE: tuple[str | None, ...] = tuple(WMO_CODE_MAP.get(i) for i in range(100))
+_UNKNOWN_WMO = "unknown (WMO %d)"
+
 _FALLBACK_WEATHER = {
     "condition": "unknown",
     "temp_c": None,
@@ -65,14 +84,20 @@ def geocode_location(location_name: str) -> tuple[float, float]:
 
     Raises ValueError if the location cannot be found.
     Raises requests.Timeout or requests.HTTPError on network issues.
+    Successful lookups are cached for GEOCODE_CACHE_TTL_S.
     """
-    resp = requests.get(
+    cache_key = disk_cache.make_key(location_name)
+    cached = disk_cache.load("geocode", cache_key, GEOCODE_CACHE_TTL_S)
+    if cached is not None:
+        return float(cached[0]), float(cached[1])
+
+    resp = _SESSION.get(
         GEOCODING_URL,
         params={"name": location_name, "count": 1, "language": "en"},
         timeout=REQUEST_TIMEOUT,
     )
     resp.raise_for_status()
-    data = resp.json()
+    data = orjson.loads(resp.content)
     results = data.get("results")
     if not results:
         raise ValueError(
@@ -80,7 +105,9 @@ def geocode_location(location_name: str) -> tuple[float, float]:
             "Check that the location name is recognisable (e.g. 'Ghent, Belgium')."
         )
     result = results[0]
-    return float(result["latitude"]), float(result["longitude"])
+    coords = float(result["latitude"]), float(result["longitude"])
+    disk_cache.store("geocode", cache_key, coords)
+    return coords
 
 
 def get_weekly_weather(
@@ -103,26 +130,45 @@ def get_weekly_weather(
     with outdoor_ok=False is returned for that day.
     """
     daily = _fetch_forecast(lat, lon)
-    date_index: dict[str, int] = {d: i for i, d in enumerate(daily["time"])}
+    # One sequential pass over the parallel daily arrays: date → (code, temp, rain)
+    forecast = dict(zip(
+        daily["time"],
+        zip(daily["weathercode"], daily["temperature_2m_max"], daily["precipitation_sum"]),
+    ))
 
     results = []
-    for filming_date in filming_dates:
-        date_str = filming_date.strftime("%Y-%m-%d")
-        idx = date_index.get(date_str)
-        if idx is None:
-            print(
-                f"Warning: {date_str} is outside the forecast window. "
-                "Using fallback weather data."
+    for date_str in map(date.isoformat, filming_dates):
+        day = forecast.get(date_str)
+        if day is None:
+            logger.warning(
+                "%s is outside the forecast window. Using fallback weather data.",
+                date_str,
             )
             results.append({"date": date_str, **_FALLBACK_WEATHER})
         else:
-            results.append(_parse_day(date_str, daily, idx))
+            results.append(_parse_day(date_str, *day))
     return results
 
 
+def clear_cache() -> None:
+    """Drop all cached geocoding results and forecasts."""
+    disk_cache.clear("geocode")
+    disk_cache.clear("forecast")
+
+
 def _fetch_forecast(lat: float, lon: float) -> dict:
-    """Return the raw daily arrays from the Open-Meteo forecast response."""
-    resp = requests.get(
+    """
+    Return the raw daily arrays from the Open-Meteo forecast response.
+
+    Cached for FORECAST_CACHE_TTL_S, keyed on the coordinates rounded to
+    about 100 m and today's date, since the 7-day window starts today.
+    """
+    cache_key = disk_cache.make_key(round(lat, 3), round(lon, 3), date.today().isoformat())
+    cached = disk_cache.load("forecast", cache_key, FORECAST_CACHE_TTL_S)
+    if cached is not None:
+        return cached
+
+    resp = _SESSION.get(
         FORECAST_URL,
         params={
             "latitude": lat,
@@ -134,23 +180,20 @@ def _fetch_forecast(lat: float, lon: float) -> dict:
         timeout=REQUEST_TIMEOUT,
     )
     resp.raise_for_status()
-    return resp.json()["daily"]
+    daily = orjson.loads(resp.content)["daily"]
+    disk_cache.store("forecast", cache_key, daily)
+    return daily
 
 
-def _parse_day(date_str: str, daily: dict, idx: int) -> dict:
-    """Extract and interpret weather data for a single forecast day."""
-    code = int(daily["weathercode"][idx] or 0)
-    temp = daily["temperature_2m_max"][idx]
-    rain = daily["precipitation_sum"][idx] or 0.0
+def _parse_day(date_str: str, code, temp, rain) -> dict:
+    """Interpret the raw forecast values for a single day."""
+    code = int(code or 0)
+    rain = float(rain or 0.0)
 
     return {
         "date": date_str,
-        "condition": _decode_wmo(code),
+        "condition": (0 <= code < 100 and _WMO_BY_CODE[code]) or _UNKNOWN_WMO % code,
         "temp_c": round(float(temp), 1) if temp is not None else None,
-        "rain_mm": round(float(rain), 1),
-        "outdoor_ok": float(rain) <= RAIN_THRESHOLD_MM,
+        "rain_mm": round(rain, 1),
+        "outdoor_ok": rain <= RAIN_THRESHOLD_MM,
     }
-
-
-def _decode_wmo(code: int) -> str:
-    return WMO_CODE_MAP.get(code, f"unknown (WMO {code})")
@@ -1,68 +1,156 @@
 """
 wikimedia.py — Wikimedia Commons image search for Vlaamse Chroniqueur.
 
-Public function:
-    find_image_url(query) → str | None
+Public functions:
+    find_image_url(query)      → str | None
+    find_image_urls(queries)   → list[str | None], one per query, searched concurrently
+    clear_cache()
 
 Returns the URL of the first suitable JPEG or PNG from Wikimedia Commons,
 or None if no suitable image is found. Suitable means: JPEG or PNG, under 25 MB.
+Found URLs are cached on disk per query (see disk_cache.py).
 """
 
 from __future__ import annotations
 
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import orjson
 import requests
 
+import disk_cache
+from http_session import make_session
+
+logger = logging.getLogger(__name__)
+
 COMMONS_API = "https://commons.wikimedia.org/w/api.php"
 MAX_FILE_SIZE_BYTES = 25 * 1024 * 1024  # 25 MB
+MAX_FILE_SIZE_KB = MAX_FILE_SIZE_BYTES // 1024  # CirrusSearch filesize: is in KB
 ALLOWED_MIME = {"image/jpeg", "image/png"}
 REQUEST_TIMEOUT = 10
+MAX_REQUESTS_PER_SECOND = 2
+MAX_CONCURRENT_REQUESTS = 2
+IMAGE_CACHE_TTL_S = 30 * 24 * 3600
+FIRST_SEARCH_LIMIT = 3   # Candidates fetched first; server-side filters make a hit likely
+MAX_SEARCH_LIMIT = 10    # Total candidates considered before giving up
 
 # Wikimedia requires a descriptive User-Agent to avoid 403 blocks
 HEADERS = {
     "User-Agent": "VlaamseChroniqueur/1.0 (https://github.com/vlaamse-chroniqueur; contact@example.com)"
 }
 
+# One pooled session per process (see http_session.py), sized for the
+# concurrent searches in find_image_urls.
+_SESSION = make_session(pool_maxsize=MAX_CONCURRENT_REQUESTS, methods=frozenset({"GET"}))
+_SESSION.headers.update(HEADERS)
+
 
 def find_image_url(query: str) -> str | None:
     """
     Search Wikimedia Commons for images matching the query.
     Returns the URL of the first JPEG or PNG under 25 MB, or None.
+    Only hits are cached, so a miss or a failed request is retried next run.
     """
+    cache_key = disk_cache.make_key(query)
+    cached = disk_cache.load("image_search", cache_key, IMAGE_CACHE_TTL_S)
+    if cached is not None:
+        return cached
+
     try:
-        candidates = _search_commons(query)
-    except requests.RequestException as exc:
-        print(f"Warning: Wikimedia search failed for '{query}': {exc}")
+        candidates, next_offset = _search_commons(query, limit=FIRST_SEARCH_LIMIT)
+        url = _first_usable(candidates)
+        if url is None and next_offset is not None:
+            # Widen on a miss, continuing where the first page of results ended
+            candidates, _ = _search_commons(
+                query,
+                limit=MAX_SEARCH_LIMIT - FIRST_SEARCH_LIMIT,
+                offset=next_offset,
+            )
+            url = _first_usable(candidates)
+    except (requests.RequestException, orjson.JSONDecodeError) as exc:
+        logger.warning("Wikimedia search failed for '%s': %s", query, exc)
         return None
 
-    for info in candidates:
-        if _is_usable(info):
-            return info["url"]
-    return None
+    if url is not None:
+        disk_cache.store("image_search", cache_key, url)
+    return url
 
 
-def _search_commons(query: str, limit: int = 10) -> list[dict]:
+def find_image_urls(queries: list[str]) -> list[str | None]:
     """
-    Query the Wikimedia Commons API and return a list of imageinfo dicts.
-    Each dict has keys: url, size, mime.
+    Run find_image_url for every query concurrently. Requests to Commons are
+    held to MAX_REQUESTS_PER_SECOND by _search_commons. Results keep query order.
+    """
+    if not queries:
+        return []
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS) as pool:
+        return list(pool.map(find_image_url, queries))
+
+
+def clear_cache() -> None:
+    """Drop all cached image search results."""
+    disk_cache.clear("image_search")
+
+
+class _RateLimiter:
+    """Space calls to wait() at least 1/rate seconds apart, across threads."""
+
+    def __init__(self, rate: float) -> None:
+        self._interval = 1.0 / rate
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self._interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+# Shared by every search in the process, so a widened search takes its own slot
+_LIMITER = _RateLimiter(MAX_REQUESTS_PER_SECOND)
+
+
+def _search_commons(
+    query: str, limit: int = MAX_SEARCH_LIMIT, offset: int = 0
+) -> tuple[list[dict], int | None]:
+    """
+    Query the Wikimedia Commons API and return (candidates, next_offset).
+    candidates is a list of imageinfo dicts in search-rank order, starting at
+    the given result offset; each dict has keys: url, size, mime.
+    next_offset is the API's gsroffset continuation, or None when the search
+    has no further results. Each call waits for a rate-limiter slot.
+
+    CirrusSearch filters out non-bitmap files and anything over 25 MB on the
+    server, so nearly every candidate returned passes _is_usable; the
+    client-side check still drops GIF/WebP, which filetype:bitmap includes.
     """
     params = {
         "action": "query",
         "format": "json",
         "generator": "search",
         "gsrnamespace": 6,  # File namespace
-        "gsrsearch": query,
+        "gsrsearch": f"{query} filetype:bitmap filesize:<{MAX_FILE_SIZE_KB}",
         "gsrlimit": limit,
+        "gsroffset": offset,
         "prop": "imageinfo",
         "iiprop": "url|size|mime",
     }
-    resp = requests.get(COMMONS_API, params=params, headers=HEADERS, timeout=REQUEST_TIMEOUT)
+    _LIMITER.wait()
+    resp = _SESSION.get(COMMONS_API, params=params, timeout=REQUEST_TIMEOUT)
     resp.raise_for_status()
 
-    data = resp.json()
+    data = orjson.loads(resp.content)
     pages = data.get("query", {}).get("pages", {})
 
     results = []
-    for page in pages.values():
+    # Pages come back keyed by page id; "index" is their search rank
+    for page in sorted(pages.values(), key=lambda p: p.get("index", 0)):
         imageinfo = page.get("imageinfo", [])
         if imageinfo:
             info = imageinfo[0]
@@ -73,7 +161,15 @@ def _search_commons(query: str, limit: int = 10) -> list[dict]:
                     "mime": info.get("mime", ""),
                 }
             )
-    return results
+    next_offset = data.get("continue", {}).get("gsroffset")
+    return results, next_offset
+
+
+def _first_usable(candidates: list[dict]) -> str | None:
+    for info in candidates:
+        if _is_usable(info):
+            return info["url"]
+    return None
 
 
 def _is_usable(imageinfo: dict) -> bool: